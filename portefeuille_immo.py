@@ -1,17 +1,20 @@
 import streamlit as st
 import pandas as pd
+import polars as pl
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 import uuid
 
 # Custom function for currency formatting
+_THOUSANDS_SEPARATOR = str.maketrans({",": " "})
+
 def format_currency(value: float) -> str:
-    """Format a number as currency with thousand separators (e.g., 1234567 -> 1,234,567)."""
-    return f"{int(value):,}".replace(",", " ")
+    """Format a number as currency with thousand separators (e.g., 1234567 -> 1 234 567)."""
+    return format(int(value), ",").translate(_THOUSANDS_SEPARATOR)
 
 # Constants
 MAX_BUILDINGS = 20
+OCCUPANCY_GROWTH_K = 0.1  # Logistic growth rate constant
+NUMBA_MIN_BUILDINGS = 512  # Portfolio size where the compiled kernel pays off
 DEFAULT_CAP_RATE = 5.0
 DEFAULT_LTV = 60.0
 DEFAULT_OCCUPANCY = 95.0
@@ -35,247 +38,283 @@ Modélisez un portefeuille d'immeubles de bureaux avec :
 - Valeur de revente
 """)
 
-# Initialize session state
-if "building_data" not in st.session_state:
-    st.session_state.building_data = []
-
-# Function to calculate building metrics
-@st.cache_data
-def calculate_building_metrics(building: dict) -> dict:
-    """Calculate financial metrics for a single building."""
-    try:
-        # Validate critical inputs
-        if building["Cap Rate Achat"] <= 0 or building["Cap Rate Sortie"] <= 0:
-            raise ValueError("Les taux de rendement doivent être supérieurs à 0.")
-        if building["Loyer Annuel"] < 0 or building["Budget Travaux"] < 0:
-            raise ValueError("Les montants monétaires ne peuvent pas être négatifs.")
-
-        # Acquisition value including works budget
-        valeur_acquisition = building["Loyer Annuel"] / (building["Cap Rate Achat"] / 100)
-        total_investment = valeur_acquisition + building["Budget Travaux"]
-
-        # Financing
-        dette = total_investment * (building["LTV"] / 100)
-        equity = total_investment - dette
-
-        # Debt service (monthly payment using amortization formula)
-        taux_interet_mensuel = building["Taux Intérêt"] / 100 / 12
-        nb_mois = building["Durée Financement"] * 12
-        if taux_interet_mensuel > 0:
-            mensualite = (dette * taux_interet_mensuel) / (1 - (1 + taux_interet_mensuel) ** (-nb_mois))
-        else:
-            mensualite = dette / nb_mois  # No interest case
-        cout_total_interet = mensualite * nb_mois - dette
-
-        # Occupancy rate with logistic growth
-        t = building["Durée Financement"]
-        evol_occupation = building["Évol Occupation"] / 100
-        occupancy_initial = building["Occupation Initiale"] / 100
-        # Logistic growth: occupancy = initial / (1 + e^(-kt)), capped at 100%
-        k = 0.1  # Growth rate constant
-        taux_occupation_final = occupancy_initial / (1 + np.exp(-k * evol_occupation * t))
-        taux_occupation_final = np.clip(taux_occupation_final * 100, 0, 100)
-
-        # Final revenue with indexation and occupancy
-        loyer_final = building["Loyer Annuel"] * ((1 + building["Indexation Loyers"] / 100) ** t)
-        revenu_final = loyer_final * (taux_occupation_final / 100)
-
-        # Operating costs
-        frais_exploitation = revenu_final * (building["Frais Exploitation"] / 100)
-        noi = revenu_final - frais_exploitation - (mensualite * 12)
-
-        # Exit value
-        valeur_sortie = revenu_final / (building["Cap Rate Sortie"] / 100)
-
-        return {
-            "Nom": building["Nom"],
-            "Valeur Acquisition (€)": round(total_investment),
-            "Dette Bancaire (€)": round(dette),
-            "Equity (€)": round(equity),
-            "Revenu Final Annuel (€)": round(revenu_final),
-            "NOI Annuel (€)": round(noi),
-            "Coût Total Intérêt (€)": round(cout_total_interet),
-            "Valeur de Sortie (€)": round(valeur_sortie)
-        }
-    except Exception as e:
-        st.error(f"Erreur pour {building['Nom']}: {str(e)}")
-        return None
-
-# Function to generate visualizations
-@st.cache_data
-def generate_visualizations(df: pd.DataFrame, num_buildings: int) -> tuple:
-    """Generate bar plots for exit value and equity/debt."""
-    # Exit value plot
-    fig1, ax1 = plt.subplots(figsize=(max(10, num_buildings * 2), 6))
-    sns.barplot(x="Nom", y="Valeur de Sortie (€)", data=df, ax=ax1, palette="Blues_d")
-    ax1.set_title("Valeur de sortie par immeuble")
-    ax1.set_ylabel("Valeur (€)")
-    plt.xticks(rotation=45, ha="right")
-    plt.tight_layout()
-
-    # Equity vs Debt stacked bar plot
-    fig2, ax2 = plt.subplots(figsize=(max(10, num_buildings * 2), 6))
-    df.plot(kind="bar", x="Nom", y=["Equity (€)", "Dette Bancaire (€)"], stacked=True, ax=ax2, color=["#1f77b4", "#ff7f0e"])
-    ax2.set_title("Equity et Dette par immeuble")
-    ax2.set_ylabel("Montant (€)")
-    plt.xticks(rotation=45, ha="right")
-    plt.tight_layout()
-
-    return fig1, fig2
-
-# Sidebar form for inputs
-st.sidebar.header("Configurer les immeubles")
-with st.sidebar.form("building_form"):
-    num_buildings = st.number_input(
-        "Nombre d'immeubles",
-        min_value=1,
-        max_value=MAX_BUILDINGS,
-        value=1,
-        step=1,
-        help="Nombre total d'immeubles à modéliser (max 20)."
+# Field order expected by simulate_portfolio for each building tuple
+BUILDING_FIELDS = (
+    "Nom", "Loyer Annuel", "Cap Rate Achat", "LTV", "Taux Intérêt",
+    "Occupation Initiale", "Évol Occupation", "Indexation Loyers",
+    "Budget Travaux", "Frais Exploitation", "Durée Financement", "Cap Rate Sortie"
+)
+
+def _results_frame(noms, total_investment, dette, equity, revenu_final, noi,
+                   cout_total_interet, valeur_sortie) -> pl.DataFrame:
+    """Round the metric arrays to whole euros and assemble the display columns."""
+    return pl.DataFrame({
+        "Nom": noms,
+        "Valeur Acquisition (€)": np.rint(total_investment).astype(np.int64),
+        "Dette Bancaire (€)": np.rint(dette).astype(np.int64),
+        "Equity (€)": np.rint(equity).astype(np.int64),
+        "Revenu Final Annuel (€)": np.rint(revenu_final).astype(np.int64),
+        "NOI Annuel (€)": np.rint(noi).astype(np.int64),
+        "Coût Total Intérêt (€)": np.rint(cout_total_interet).astype(np.int64),
+        "Valeur de Sortie (€)": np.rint(valeur_sortie).astype(np.int64)
+    })
+
+@st.cache_resource
+def _get_simulation_kernel():
+    """Compile the fused Numba kernel once per server process.
+
+    Numba is imported lazily so portfolios below NUMBA_MIN_BUILDINGS never
+    pay its import or compile time; cache=True persists the compiled
+    artifact across restarts.
+    """
+    from numba import njit
+
+    @njit(cache=True, fastmath=True)
+    def _simulate(loyer_annuel, cap_achat_frac, ltv_frac, taux_frac, occ_init_frac,
+                  evol_frac, indexation_frac, budget_travaux, frais_frac,
+                  duree_financement, cap_sortie_frac):
+        # Percentage inputs arrive pre-normalized to fractions
+        n = loyer_annuel.shape[0]
+        total_investment = np.empty(n)
+        dette = np.empty(n)
+        equity = np.empty(n)
+        revenu_final = np.empty(n)
+        noi = np.empty(n)
+        cout_total_interet = np.empty(n)
+        valeur_sortie = np.empty(n)
+        for i in range(n):
+            valeur_acquisition = loyer_annuel[i] / cap_achat_frac[i]
+            ti = valeur_acquisition + budget_travaux[i]
+            d = ti * ltv_frac[i]
+            taux_mensuel = taux_frac[i] / 12
+            nb_mois = duree_financement[i] * 12
+            if taux_mensuel > 0:
+                mensualite = (d * taux_mensuel) / (1 - (1 + taux_mensuel) ** (-nb_mois))
+            else:
+                mensualite = d / nb_mois  # No interest case
+            occ = occ_init_frac[i] / (
+                1 + np.exp(-OCCUPANCY_GROWTH_K * evol_frac[i] * duree_financement[i])
+            )
+            occ = min(1.0, max(0.0, occ))
+            loyer_final = loyer_annuel[i] * (1 + indexation_frac[i]) ** duree_financement[i]
+            rf = loyer_final * occ
+            total_investment[i] = ti
+            dette[i] = d
+            equity[i] = ti - d
+            revenu_final[i] = rf
+            noi[i] = rf - rf * frais_frac[i] - mensualite * 12
+            cout_total_interet[i] = mensualite * nb_mois - d
+            valeur_sortie[i] = rf / cap_sortie_frac[i]
+        return (total_investment, dette, equity, revenu_final, noi,
+                cout_total_interet, valeur_sortie)
+
+    return _simulate
+
+# Function to simulate the whole portfolio in one vectorized pass
+@st.cache_data(max_entries=8)
+def simulate_portfolio(buildings: tuple) -> pl.DataFrame:
+    """Calculate financial metrics for all buildings at once.
+
+    `buildings` is a tuple of tuples following BUILDING_FIELDS, so the whole
+    portfolio is hashed once for caching and all formulas run as NumPy
+    array operations instead of one Python call per building. Results come
+    back as a Polars DataFrame (Arrow-backed, no per-column type inference);
+    callers convert to pandas only where display requires it.
+    """
+    noms = [b[0] for b in buildings]
+    (loyer_annuel, cap_rate_achat, ltv, taux_interet, occupation_initiale,
+     evol_occupation, indexation_loyers, budget_travaux, frais_exploitation_pct,
+     duree_financement, cap_rate_sortie) = (
+        np.asarray(col, dtype=float) for col in zip(*(b[1:] for b in buildings))
     )
 
-    building_data = []
-    for i in range(num_buildings):
-        st.subheader(f"Immeuble {i+1}")
-        st.markdown("**Nom** : Nom ou identifiant de l'immeuble.")
-        name = st.text_input(f"Nom immeuble {i+1}", value=f"Immeuble {i+1}", key=f"name_{i}")
-        st.markdown("**Loyer brut annuel** : Revenu locatif annuel brut en €.")
-        loyer_annuel = st.number_input(
-            f"Loyer brut annuel (€) {i+1}",
-            min_value=0,
-            value=100000,
-            step=1000,
-            key=f"loyer_{i}"
-        )
-        st.markdown("**Taux de rendement initial** : Cap rate à l'achat (%).")
-        cap_rate_achat = st.number_input(
-            f"Taux rendement initial (%) {i+1}",
-            min_value=0.1,
-            max_value=20.0,
-            value=DEFAULT_CAP_RATE,
-            step=0.1,
-            key=f"cap_achat_{i}"
-        )
-        st.markdown("**LTV** : Loan-to-Value, pourcentage financé par la banque (%).")
-        ltv = st.number_input(
-            f"LTV (%) {i+1}",
-            min_value=0.0,
-            max_value=100.0,
-            value=DEFAULT_LTV,
-            step=1.0,
-            key=f"ltv_{i}"
-        )
-        st.markdown("**Taux d'intérêt** : Taux annuel du prêt bancaire (%).")
-        taux_interet = st.number_input(
-            f"Taux d'intérêt (%/an) {i+1}",
-            min_value=0.0,
-            max_value=15.0,
-            value=DEFAULT_INTEREST_RATE,
-            step=0.1,
-            key=f"interet_{i}"
-        )
-        st.markdown("**Taux d'occupation initial** : Pourcentage de location initial (%).")
-        taux_occupation_init = st.number_input(
-            f"Taux d'occupation initial (%) {i+1}",
-            min_value=0.0,
-            max_value=100.0,
-            value=DEFAULT_OCCUPANCY,
-            step=1.0,
-            key=f"occup_init_{i}"
-        )
-        st.markdown("**Évolution taux occupation** : Variation annuelle du taux d'occupation (%/an).")
-        evol_occupation = st.number_input(
-            f"Évolution taux occupation (%/an) {i+1}",
-            min_value=-10.0,
-            max_value=10.0,
-            value=0.0,
-            step=0.1,
-            key=f"evol_occup_{i}"
-        )
-        st.markdown("**Indexation loyers** : Augmentation annuelle des loyers (%/an).")
-        indexation_loyers = st.number_input(
-            f"Indexation loyers (%/an) {i+1}",
-            min_value=0.0,
-            max_value=10.0,
-            value=DEFAULT_INDEXATION,
-            step=0.1,
-            key=f"indexation_{i}"
-        )
-        st.markdown("**Budget travaux** : Montant des travaux ou rénovations (€).")
-        budget_travaux = st.number_input(
-            f"Budget travaux (€) {i+1}",
-            min_value=0,
-            value=50000,
-            step=1000,
-            key=f"travaux_{i}"
-        )
-        st.markdown("**Frais exploitation** : Frais d'exploitation annuels (% du loyer).")
-        frais_exploitation = st.number_input(
-            f"Frais exploitation (% loyer) {i+1}",
-            min_value=0.0,
-            max_value=100.0,
-            value=DEFAULT_OPERATING_COSTS,
-            step=1.0,
-            key=f"frais_expl_{i}"
-        )
-        st.markdown("**Durée financement** : Durée du prêt bancaire (années).")
-        duree_financement = st.number_input(
-            f"Durée financement (années) {i+1}",
-            min_value=1,
-            max_value=30,
-            value=7,
-            step=1,
-            key=f"duree_{i}"
-        )
-        st.markdown("**Taux rendement sortie** : Cap rate à la revente (%).")
-        cap_rate_sortie = st.number_input(
-            f"Taux rendement sortie (%) {i+1}",
-            min_value=0.1,
-            max_value=20.0,
-            value=6.0,
-            step=0.1,
-            key=f"cap_sortie_{i}"
-        )
+    # Validate critical inputs
+    if np.any(cap_rate_achat <= 0) or np.any(cap_rate_sortie <= 0):
+        raise ValueError("Les taux de rendement doivent être supérieurs à 0.")
+    if np.any(loyer_annuel < 0) or np.any(budget_travaux < 0):
+        raise ValueError("Les montants monétaires ne peuvent pas être négatifs.")
+
+    # Normalize every percentage field to a fraction once on ingestion
+    # (multiply by constant instead of a division at each use site)
+    cap_achat_frac = cap_rate_achat * 0.01
+    ltv_frac = ltv * 0.01
+    taux_frac = taux_interet * 0.01
+    occ_init_frac = occupation_initiale * 0.01
+    evol_frac = evol_occupation * 0.01
+    indexation_frac = indexation_loyers * 0.01
+    frais_frac = frais_exploitation_pct * 0.01
+    cap_sortie_frac = cap_rate_sortie * 0.01
+
+    # Large portfolios (sensitivity scans, Monte Carlo extensions) go through
+    # the compiled kernel: one fused loop, no intermediate arrays
+    if len(buildings) >= NUMBA_MIN_BUILDINGS:
+        kernel = _get_simulation_kernel()
+        return _results_frame(noms, *kernel(
+            loyer_annuel, cap_achat_frac, ltv_frac, taux_frac, occ_init_frac,
+            evol_frac, indexation_frac, budget_travaux, frais_frac,
+            duree_financement, cap_sortie_frac
+        ))
 
-        building_data.append({
-            "Nom": name,
-            "Loyer Annuel": loyer_annuel,
-            "Cap Rate Achat": cap_rate_achat,
-            "LTV": ltv,
-            "Taux Intérêt": taux_interet,
-            "Occupation Initiale": taux_occupation_init,
-            "Évol Occupation": evol_occupation,
-            "Indexation Loyers": indexation_loyers,
-            "Budget Travaux": budget_travaux,
-            "Frais Exploitation": frais_exploitation,
-            "Durée Financement": duree_financement,
-            "Cap Rate Sortie": cap_rate_sortie
-        })
+    B = pd.DataFrame({
+        "loyer": loyer_annuel,
+        "cap_achat": cap_achat_frac,
+        "ltv": ltv_frac,
+        "taux": taux_frac,
+        "occ_init": occ_init_frac,
+        "evol": evol_frac,
+        "indexation": indexation_frac,
+        "travaux": budget_travaux,
+        "frais": frais_frac,
+        "duree": duree_financement,
+        "cap_sortie": cap_sortie_frac
+    })
 
+    # Logistic growth for occupancy: occ = initial / (1 + e^(-kt))
+    k = OCCUPANCY_GROWTH_K
+
+    # Pointwise chains go through DataFrame.eval so numexpr fuses each block
+    # into one kernel instead of allocating an intermediate array per op
+    B.eval("""
+valeur_acquisition = loyer / cap_achat
+total_investment = valeur_acquisition + travaux
+dette = total_investment * ltv
+equity = total_investment - dette
+taux_occupation_final = occ_init / (1 + exp(-@k * evol * duree))
+loyer_final = loyer * (1 + indexation) ** duree
+""", inplace=True)
+    B["taux_occupation_final"] = B["taux_occupation_final"].clip(0, 1)
+
+    # Debt service (monthly payment using amortization formula, branchless).
+    # safe_m keeps the annuity arm free of 0/0 for zero-rate rows, whose
+    # actual payment comes from the exact dette / nb_mois arm.
+    taux_interet_mensuel = B["taux"].to_numpy() / 12
+    nb_mois = B["duree"].to_numpy() * 12
+    dette = B["dette"].to_numpy()
+    safe_m = np.where(taux_interet_mensuel == 0, 1e-12, taux_interet_mensuel)
+    B["mensualite"] = np.where(
+        taux_interet_mensuel > 0,
+        (dette * safe_m) / (1 - (1 + safe_m) ** (-nb_mois)),
+        dette / nb_mois  # No interest case
+    )
+
+    B.eval("""
+cout_total_interet = mensualite * (duree * 12) - dette
+revenu_final = loyer_final * taux_occupation_final
+frais_exploitation = revenu_final * frais
+noi = revenu_final - frais_exploitation - mensualite * 12
+valeur_sortie = revenu_final / cap_sortie
+""", inplace=True)
+
+    return _results_frame(
+        noms,
+        B["total_investment"].to_numpy(), B["dette"].to_numpy(), B["equity"].to_numpy(),
+        B["revenu_final"].to_numpy(), B["noi"].to_numpy(),
+        B["cout_total_interet"].to_numpy(), B["valeur_sortie"].to_numpy()
+    )
+
+# Sidebar form for inputs: one data editor row per building
+st.sidebar.header("Configurer les immeubles")
+
+BUILDING_DEFAULTS = {
+    "Nom": "Immeuble 1",
+    "Loyer Annuel": 100000,
+    "Cap Rate Achat": DEFAULT_CAP_RATE,
+    "LTV": DEFAULT_LTV,
+    "Taux Intérêt": DEFAULT_INTEREST_RATE,
+    "Occupation Initiale": DEFAULT_OCCUPANCY,
+    "Évol Occupation": 0.0,
+    "Indexation Loyers": DEFAULT_INDEXATION,
+    "Budget Travaux": 50000,
+    "Frais Exploitation": DEFAULT_OPERATING_COSTS,
+    "Durée Financement": 7,
+    "Cap Rate Sortie": 6.0
+}
+
+BUILDING_COLUMN_CONFIG = {
+    "Nom": st.column_config.TextColumn("Nom"),
+    "Loyer Annuel": st.column_config.NumberColumn("Loyer brut annuel (€)", min_value=0, step=1000),
+    "Cap Rate Achat": st.column_config.NumberColumn("Taux rendement initial (%)", min_value=0.1, max_value=20.0, step=0.1),
+    "LTV": st.column_config.NumberColumn("LTV (%)", min_value=0.0, max_value=100.0, step=1.0),
+    "Taux Intérêt": st.column_config.NumberColumn("Taux d'intérêt (%/an)", min_value=0.0, max_value=15.0, step=0.1),
+    "Occupation Initiale": st.column_config.NumberColumn("Taux d'occupation initial (%)", min_value=0.0, max_value=100.0, step=1.0),
+    "Évol Occupation": st.column_config.NumberColumn("Évolution taux occupation (%/an)", min_value=-10.0, max_value=10.0, step=0.1),
+    "Indexation Loyers": st.column_config.NumberColumn("Indexation loyers (%/an)", min_value=0.0, max_value=10.0, step=0.1),
+    "Budget Travaux": st.column_config.NumberColumn("Budget travaux (€)", min_value=0, step=1000),
+    "Frais Exploitation": st.column_config.NumberColumn("Frais exploitation (% loyer)", min_value=0.0, max_value=100.0, step=1.0),
+    "Durée Financement": st.column_config.NumberColumn("Durée financement (années)", min_value=1, max_value=30, step=1),
+    "Cap Rate Sortie": st.column_config.NumberColumn("Taux rendement sortie (%)", min_value=0.1, max_value=20.0, step=0.1)
+}
+
+HELP_BLOCK = """
+- **Nom** : Nom ou identifiant de l'immeuble.
+- **Loyer brut annuel** : Revenu locatif annuel brut en €.
+- **Taux de rendement initial** : Cap rate à l'achat (%).
+- **LTV** : Loan-to-Value, pourcentage financé par la banque (%).
+- **Taux d'intérêt** : Taux annuel du prêt bancaire (%).
+- **Taux d'occupation initial** : Pourcentage de location initial (%).
+- **Évolution taux occupation** : Variation annuelle du taux d'occupation (%/an).
+- **Indexation loyers** : Augmentation annuelle des loyers (%/an).
+- **Budget travaux** : Montant des travaux ou rénovations (€).
+- **Frais exploitation** : Frais d'exploitation annuels (% du loyer).
+- **Durée financement** : Durée du prêt bancaire (années).
+- **Taux rendement sortie** : Cap rate à la revente (%).
+"""
+
+with st.sidebar.expander("Aide / Définitions"):
+    st.markdown(HELP_BLOCK)
+
+with st.sidebar.form("building_form"):
+    edited = st.data_editor(
+        pd.DataFrame([BUILDING_DEFAULTS]),
+        column_config=BUILDING_COLUMN_CONFIG,
+        num_rows="dynamic",
+        hide_index=True,
+        key="buildings"
+    )
     submitted = st.form_submit_button("Lancer la simulation")
 
 # Simulation
-if submitted and num_buildings > 0:
-    st.session_state.building_data = building_data
-    results = []
-    total_equity, total_dette, total_valeur_sortie, total_noi = 0, 0, 0, 0
-
-    for b in st.session_state.building_data:
-        result = calculate_building_metrics(b)
-        if result:
-            results.append(result)
-            total_equity += result["Equity (€)"]
-            total_dette += result["Dette Bancaire (€)"]
-            total_valeur_sortie += result["Valeur de Sortie (€)"]
-            total_noi += result["NOI Annuel (€)"]
-
-    if results:
-        df = pd.DataFrame(results)
-
-        # Display results
+if submitted and len(edited) > 0 and len(edited) <= MAX_BUILDINGS:
+    # Rows added dynamically start empty: fall back to defaults and numbered names
+    building_df = edited.fillna({f: d for f, d in BUILDING_DEFAULTS.items() if f != "Nom"})
+    building_df["Nom"] = [
+        nom if isinstance(nom, str) and nom.strip() else f"Immeuble {i+1}"
+        for i, nom in enumerate(building_df["Nom"])
+    ]
+    # Plain-tuple rows straight from the frame: no dict materialization,
+    # no per-field hash lookups
+    buildings_tuple = tuple(
+        building_df[list(BUILDING_FIELDS)].itertuples(index=False, name=None)
+    )
+
+    # Memoize on the input hash: identical resubmissions and idle reruns
+    # reuse the stored frame instead of recomputing
+    portfolio_key = hash(buildings_tuple)
+    if st.session_state.get("last_key") != portfolio_key:
+        try:
+            st.session_state.last_df = simulate_portfolio(buildings_tuple)
+        except ValueError as e:
+            st.error(f"Erreur dans les données saisies : {str(e)}")
+            st.session_state.last_df = None
+        st.session_state.last_key = portfolio_key
+
+    df_pl = st.session_state.last_df
+
+    if df_pl is not None:
+        total_equity, total_dette, total_valeur_sortie, total_noi = df_pl.select(
+            pl.col("Equity (€)").sum(),
+            pl.col("Dette Bancaire (€)").sum(),
+            pl.col("Valeur de Sortie (€)").sum(),
+            pl.col("NOI Annuel (€)").sum()
+        ).row(0)
+
+        # Convert once for the pandas-facing display elements
+        df = df_pl.to_pandas()
+
+        # Display results (static table: no Arrow/grid component for ≤20 rows)
         st.subheader("Résultats par immeuble")
-        st.dataframe(df, use_container_width=True)
+        money_columns = [c for c in df.columns if c != "Nom"]
+        st.table(df.style.format(format_currency, subset=money_columns).hide(axis="index"))
 
         # Portfolio summary
         st.subheader("Résultats globaux du portefeuille")
@@ -284,13 +323,14 @@ if submitted and num_buildings > 0:
         st.write(f"**NOI Annuel total :** {format_currency(total_noi)} €")
         st.write(f"**Valeur finale projetée :** {format_currency(total_valeur_sortie)} €")
 
-        # Visualizations
-        fig1, fig2 = generate_visualizations(df, num_buildings)
-        st.pyplot(fig1)
-        st.pyplot(fig2)
+        # Visualizations (native charts, rendered client-side)
+        st.subheader("Valeur de sortie par immeuble")
+        st.bar_chart(df.set_index("Nom")["Valeur de Sortie (€)"])
+        st.subheader("Equity et Dette par immeuble")
+        st.bar_chart(df.set_index("Nom")[["Equity (€)", "Dette Bancaire (€)"]], stack=True)
 
-        # Export results
-        csv = df.to_csv(index=False)
+        # Export results (Polars CSV writer, no pandas round-trip)
+        csv = df_pl.write_csv()
         st.download_button(
             label="Télécharger les résultats",
             data=csv,
@@ -299,6 +339,8 @@ if submitted and num_buildings > 0:
         )
     else:
         st.error("Aucun résultat valide. Vérifiez les données saisies.")
-else:
-    if num_buildings == 0:
-        st.warning("Veuillez ajouter au moins un immeuble.")
\ No newline at end of file
+elif submitted:
+    if len(edited) == 0:
+        st.warning("Veuillez ajouter au moins un immeuble.")
+    else:
+        st.error(f"Le portefeuille est limité à {MAX_BUILDINGS} immeubles.")
\ No newline at end of file